@@ -74,11 +74,8 @@ async fn main() {
     fs::create_dir_all(&artifact_root).unwrap();
     println!("Artifacts: {}", artifact_root.display());
 
+    // A task file names a single repo that `task::load` copies onto every task.
     let repo = tasks.first().unwrap().repo.clone();
-    assert!(
-        tasks.iter().all(|task| task.repo == repo),
-        "all tasks in one task file must use the same repo"
-    );
     let repo_root = cli.repo_root.unwrap_or_else(default_repo_root);
     println!("Repo root: {}", repo_root.display());
     let checkout = runner::checkout_repo(&repo, &repo_root);
@@ -136,20 +133,14 @@ fn default_artifact_root(tasks_path: &Path) -> PathBuf {
         .file_stem()
         .and_then(|name| name.to_str())
         .unwrap_or("tasks");
-    workspace_root()
+    runner::workspace_root()
         .join("target")
         .join("llmcc-bench-artifacts")
         .join(task_file)
 }
 
 fn default_repo_root() -> PathBuf {
-    workspace_root().join("target").join("llmcc-bench-repos")
-}
-
-fn workspace_root() -> PathBuf {
-    PathBuf::from(env!("CARGO_MANIFEST_DIR"))
-        .parent()
-        .and_then(Path::parent)
-        .unwrap()
-        .to_path_buf()
+    runner::workspace_root()
+        .join("target")
+        .join("llmcc-bench-repos")
 }
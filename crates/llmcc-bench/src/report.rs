@@ -1,20 +1,30 @@
 //! Report benchmark results as a table and optional CSV.
 
+use std::borrow::Cow;
+use std::fmt::Write as _;
 use std::fs;
+use std::io::{self, BufWriter, Write as _};
 use std::path::Path;
 
 use crate::runner::{Mode, RunResult};
 
 /// Print per-task detail table.
+///
+/// Rows go through one buffered, locked stdout handle so a large run is emitted
+/// in a few writes instead of one flush per line.
 pub fn print_detail(results: &[RunResult]) {
-    println!(
+    let mut out = BufWriter::new(io::stdout().lock());
+    writeln!(
+        out,
         "{:<32} | {:<8} | {:>8} | {:>8} | {:>8} | {:>5} | {:>8}",
         "task_id", "mode", "in (k)", "cached", "out (k)", "tools", "time_s"
-    );
-    println!("{}", "-".repeat(94));
+    )
+    .unwrap();
+    writeln!(out, "{}", "-".repeat(94)).unwrap();
 
     for r in results {
-        println!(
+        writeln!(
+            out,
             "{:<32} | {:<8} | {:>8.1} | {:>8.1} | {:>8.1} | {:>5} | {:>8.1}",
             r.task_id,
             r.mode,
@@ -23,40 +33,30 @@ pub fn print_detail(results: &[RunResult]) {
             r.output_tokens as f64 / 1000.0,
             r.tool_calls,
             r.wall_time_s,
-        );
+        )
+        .unwrap();
     }
+    out.flush().unwrap();
 }
 
 /// Print aggregate summary comparing baseline vs llmcc modes.
 pub fn print_summary(results: &[RunResult]) {
-    let baseline: Vec<_> = results
-        .iter()
-        .filter(|r| r.mode == Mode::Baseline)
-        .collect();
-    let llmcc: Vec<_> = results
-        .iter()
-        .filter(|r| r.mode == Mode::WithLlmcc)
-        .collect();
+    let mut baseline = ModeAverages::default();
+    let mut llmcc = ModeAverages::default();
+    for r in results {
+        match r.mode {
+            Mode::Baseline => baseline.add(r),
+            Mode::WithLlmcc => llmcc.add(r),
+        }
+    }
 
-    if baseline.is_empty() || llmcc.is_empty() {
+    if baseline.runs == 0 || llmcc.runs == 0 {
         return;
     }
 
-    let avg = |items: &[&RunResult], f: fn(&RunResult) -> f64| -> f64 {
-        items.iter().map(|r| f(r)).sum::<f64>() / items.len() as f64
-    };
-
-    let b_in = avg(&baseline, |r| r.input_tokens as f64 / 1000.0);
-    let b_cached = avg(&baseline, |r| r.cached_input_tokens as f64 / 1000.0);
-    let b_out = avg(&baseline, |r| r.output_tokens as f64 / 1000.0);
-    let b_tools = avg(&baseline, |r| r.tool_calls as f64);
-    let b_time = avg(&baseline, |r| r.wall_time_s);
-
-    let l_in = avg(&llmcc, |r| r.input_tokens as f64 / 1000.0);
-    let l_cached = avg(&llmcc, |r| r.cached_input_tokens as f64 / 1000.0);
-    let l_out = avg(&llmcc, |r| r.output_tokens as f64 / 1000.0);
-    let l_tools = avg(&llmcc, |r| r.tool_calls as f64);
-    let l_time = avg(&llmcc, |r| r.wall_time_s);
+    let tasks = baseline.runs;
+    let b = baseline.finish();
+    let l = llmcc.finish();
 
     let delta = |base: f64, with: f64| -> String {
         if base == 0.0 {
@@ -67,7 +67,7 @@ pub fn print_summary(results: &[RunResult]) {
     };
 
     println!();
-    println!("Summary ({} tasks)", baseline.len());
+    println!("Summary ({tasks} tasks)");
     println!("{}", "-".repeat(64));
     println!(
         "{:<16} | {:>12} | {:>12} | {:>8}",
@@ -77,50 +77,85 @@ pub fn print_summary(results: &[RunResult]) {
     println!(
         "{:<16} | {:>10.1} k | {:>10.1} k | {:>8}",
         "input_tokens",
-        b_in,
-        l_in,
-        delta(b_in, l_in)
+        b.input_k,
+        l.input_k,
+        delta(b.input_k, l.input_k)
     );
     println!(
         "{:<16} | {:>10.1} k | {:>10.1} k | {:>8}",
         "cached_tokens",
-        b_cached,
-        l_cached,
-        delta(b_cached, l_cached)
+        b.cached_k,
+        l.cached_k,
+        delta(b.cached_k, l.cached_k)
     );
     println!(
         "{:<16} | {:>10.1} k | {:>10.1} k | {:>8}",
         "output_tokens",
-        b_out,
-        l_out,
-        delta(b_out, l_out)
+        b.output_k,
+        l.output_k,
+        delta(b.output_k, l.output_k)
     );
     println!(
         "{:<16} | {:>12.1} | {:>12.1} | {:>8}",
         "tool_calls",
-        b_tools,
-        l_tools,
-        delta(b_tools, l_tools)
+        b.tool_calls,
+        l.tool_calls,
+        delta(b.tool_calls, l.tool_calls)
     );
     println!(
         "{:<16} | {:>10.1} s | {:>10.1} s | {:>8}",
         "wall_time",
-        b_time,
-        l_time,
-        delta(b_time, l_time)
+        b.wall_time_s,
+        l.wall_time_s,
+        delta(b.wall_time_s, l.wall_time_s)
     );
 }
 
+/// Per-mode metric sums, turned into averages by [`ModeAverages::finish`].
+#[derive(Debug, Default)]
+struct ModeAverages {
+    runs: usize,
+    input_k: f64,
+    cached_k: f64,
+    output_k: f64,
+    tool_calls: f64,
+    wall_time_s: f64,
+}
+
+impl ModeAverages {
+    fn add(&mut self, r: &RunResult) {
+        self.runs += 1;
+        self.input_k += r.input_tokens as f64 / 1000.0;
+        self.cached_k += r.cached_input_tokens as f64 / 1000.0;
+        self.output_k += r.output_tokens as f64 / 1000.0;
+        self.tool_calls += r.tool_calls as f64;
+        self.wall_time_s += r.wall_time_s;
+    }
+
+    fn finish(self) -> Self {
+        let n = self.runs as f64;
+        Self {
+            runs: self.runs,
+            input_k: self.input_k / n,
+            cached_k: self.cached_k / n,
+            output_k: self.output_k / n,
+            tool_calls: self.tool_calls / n,
+            wall_time_s: self.wall_time_s / n,
+        }
+    }
+}
+
 /// Write results to a CSV file.
 pub fn write_csv(results: &[RunResult], path: &Path) {
-    let mut lines = Vec::with_capacity(results.len() + 1);
-    lines.push(
-        "task_id,mode,input_tokens_k,cached_input_tokens_k,output_tokens_k,tool_calls,wall_time_s"
-            .into(),
-    );
+    const HEADER: &str =
+        "task_id,mode,input_tokens_k,cached_input_tokens_k,output_tokens_k,tool_calls,wall_time_s";
+
+    let mut csv = String::with_capacity(HEADER.len() + results.len() * 64);
+    csv.push_str(HEADER);
     for r in results {
-        lines.push(format!(
-            "{},{},{:.1},{:.1},{:.1},{},{:.1}",
+        write!(
+            csv,
+            "\n{},{},{:.1},{:.1},{:.1},{},{:.1}",
             csv_escape(&r.task_id),
             r.mode,
             r.input_tokens as f64 / 1000.0,
@@ -128,16 +163,17 @@ pub fn write_csv(results: &[RunResult], path: &Path) {
             r.output_tokens as f64 / 1000.0,
             r.tool_calls,
             r.wall_time_s,
-        ));
+        )
+        .unwrap();
     }
-    fs::write(path, lines.join("\n")).unwrap();
+    fs::write(path, csv).unwrap();
     println!("\nResults written to {}", path.display());
 }
 
-fn csv_escape(value: &str) -> String {
+fn csv_escape(value: &str) -> Cow<'_, str> {
     if value.contains([',', '"', '\n']) {
-        format!("\"{}\"", value.replace('"', "\"\""))
+        Cow::Owned(format!("\"{}\"", value.replace('"', "\"\"")))
     } else {
-        value.to_string()
+        Cow::Borrowed(value)
     }
 }
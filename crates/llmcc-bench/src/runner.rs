@@ -2,6 +2,7 @@
 
 use std::fs;
 use std::path::{Path, PathBuf};
+use std::sync::OnceLock;
 use std::time::Instant;
 
 use tokio::io::AsyncWriteExt;
@@ -66,7 +67,7 @@ pub fn checkout_repo(repo: &str, repo_root: &Path) -> RepoCheckout {
 /// Clone a repo into the given directory.
 fn clone_repo(repo: &str, dest: &Path) {
     let status = std::process::Command::new("git")
-        .args(["clone", "--depth", "1", repo])
+        .args(["clone", "--depth", "1", "--no-tags", repo])
         .arg(dest)
         .status()
         .unwrap();
@@ -84,10 +85,15 @@ fn repo_dir_name(repo: &str) -> String {
 }
 
 /// Build the tool hint that tells the agent about llmcc availability.
-fn llmcc_tool_hint(llmcc_path: &Path) -> String {
-    let path_str = llmcc_path.display();
-    format!(
-        r#"You have access to `llmcc`, a codebase architecture tool.
+///
+/// The hint only depends on the release binary path, so it is rendered once and
+/// shared by every llmcc-mode task.
+fn llmcc_tool_hint() -> &'static str {
+    static HINT: OnceLock<String> = OnceLock::new();
+    HINT.get_or_init(|| {
+        let path_str = release_llmcc_binary().display();
+        format!(
+            r#"You have access to `llmcc`, a codebase architecture tool.
 
 Usage: {path_str} --dir <DIR> --depth <DEPTH> --ai true
 
@@ -109,24 +115,30 @@ When NOT to use llmcc (use grep/find/read instead):
 
 You can scope it to subdirectories: --dir <path-to-specific-crate> for focused views.
 Start at depth 1 to orient, then narrow to specific packages at depth 2 or 3."#
-    )
+        )
+    })
 }
 
-fn release_llmcc_binary() -> PathBuf {
-    let binary = target_dir(&workspace_root())
-        .join("release")
-        .join(if cfg!(windows) { "llmcc.exe" } else { "llmcc" });
-
-    assert!(
-        binary.exists(),
-        "release llmcc binary not found at {}; run `cargo build --release -p llmcc` before benchmarking",
-        binary.display()
-    );
-
-    binary
+/// Locate the release llmcc binary once; every llmcc-mode task reuses the resolved path.
+fn release_llmcc_binary() -> &'static Path {
+    static BINARY: OnceLock<PathBuf> = OnceLock::new();
+    BINARY.get_or_init(|| {
+        let binary = target_dir(&workspace_root())
+            .join("release")
+            .join(if cfg!(windows) { "llmcc.exe" } else { "llmcc" });
+
+        assert!(
+            binary.exists(),
+            "release llmcc binary not found at {}; run `cargo build --release -p llmcc` before benchmarking",
+            binary.display()
+        );
+
+        binary
+    })
 }
 
-fn workspace_root() -> PathBuf {
+/// Return the llmcc workspace root, two levels above this crate's manifest.
+pub fn workspace_root() -> PathBuf {
     PathBuf::from(env!("CARGO_MANIFEST_DIR"))
         .parent()
         .and_then(Path::parent)
@@ -149,6 +161,8 @@ async fn run_codex(prompt: &str, work_dir: &Path) -> CodexOutput {
         .stdin(std::process::Stdio::piped())
         .stdout(std::process::Stdio::piped())
         .stderr(std::process::Stdio::piped())
+        // Jobs run concurrently; if the run aborts, don't leave codex processes behind.
+        .kill_on_drop(true)
         .spawn()
         .unwrap();
 
@@ -163,11 +177,17 @@ async fn run_codex(prompt: &str, work_dir: &Path) -> CodexOutput {
     let output = child.wait_with_output().await.unwrap();
     CodexOutput {
         success: output.status.success(),
-        stdout: String::from_utf8_lossy(&output.stdout).to_string(),
-        stderr: String::from_utf8_lossy(&output.stderr).to_string(),
+        stdout: into_string_lossy(output.stdout),
+        stderr: into_string_lossy(output.stderr),
     }
 }
 
+/// Take ownership of captured output, copying only when it is not valid UTF-8.
+fn into_string_lossy(bytes: Vec<u8>) -> String {
+    String::from_utf8(bytes)
+        .unwrap_or_else(|err| String::from_utf8_lossy(err.as_bytes()).into_owned())
+}
+
 struct CodexOutput {
     success: bool,
     stdout: String,
@@ -194,7 +214,12 @@ pub async fn verify_codex_tool_execution(work_dir: &Path) {
     );
 
     let codex = run_codex(&prompt, work_dir).await;
-    let metrics = parse_metrics(&codex.stdout);
+    let events: Vec<serde_json::Value> = codex
+        .stdout
+        .lines()
+        .filter_map(|line| serde_json::from_str(line).ok())
+        .collect();
+    let metrics = parse_metrics(&events);
     let marker_created = marker_path.exists();
     let _ = fs::remove_file(&marker_path);
 
@@ -220,15 +245,19 @@ struct Metrics {
     tool_calls: u32,
 }
 
-/// Parse JSONL codex output to extract token usage and tool call count.
-fn parse_metrics(jsonl: &str) -> Metrics {
-    let mut metrics = Metrics::default();
+/// Parse codex JSONL output once; every artifact and the metrics reuse the events.
+fn parse_events(jsonl: &str) -> Vec<serde_json::Value> {
+    jsonl
+        .lines()
+        .map(|line| serde_json::from_str(line).unwrap())
+        .collect()
+}
 
-    for line in jsonl.lines() {
-        let Ok(event) = serde_json::from_str::<serde_json::Value>(line) else {
-            continue;
-        };
+/// Extract token usage and tool call count from codex events.
+fn parse_metrics(events: &[serde_json::Value]) -> Metrics {
+    let mut metrics = Metrics::default();
 
+    for event in events {
         // Count tool calls from item.completed events.
         if event.get("type").and_then(|t| t.as_str()) == Some("item.completed") {
             if let Some(item) = event.get("item") {
@@ -282,14 +311,11 @@ pub async fn run_task(task: &Task, mode: Mode, repo_dir: &Path, artifact_root: &
     // Build prompt.
     let prompt = match mode {
         Mode::Baseline => task.description.clone(),
-        Mode::WithLlmcc => {
-            let llmcc_path = release_llmcc_binary();
-            format!(
-                "{llmcc_hint}\n\nTask:\n{task_desc}",
-                llmcc_hint = llmcc_tool_hint(&llmcc_path),
-                task_desc = task.description,
-            )
-        }
+        Mode::WithLlmcc => format!(
+            "{llmcc_hint}\n\nTask:\n{task_desc}",
+            llmcc_hint = llmcc_tool_hint(),
+            task_desc = task.description,
+        ),
     };
     write_artifact(&artifact_dir.join("prompt.txt"), &prompt);
 
@@ -297,23 +323,21 @@ pub async fn run_task(task: &Task, mode: Mode, repo_dir: &Path, artifact_root: &
     let start = Instant::now();
     let codex = run_codex(&prompt, repo_dir).await;
     let wall_time_s = start.elapsed().as_secs_f64();
+    let events = parse_events(&codex.stdout);
     write_artifact(
         &artifact_dir.join("codex.json"),
-        &pretty_codex_jsonl(&codex.stdout),
+        &pretty_codex_events(&events),
     );
     write_artifact(
         &artifact_dir.join("codex.txt"),
-        &readable_codex_jsonl(&codex.stdout),
-    );
-    write_artifact(
-        &artifact_dir.join("tools.txt"),
-        &tool_transcript(&codex.stdout),
+        &readable_codex_events(&events),
     );
+    write_artifact(&artifact_dir.join("tools.txt"), &tool_transcript(&events));
     write_artifact(&artifact_dir.join("codex.stderr"), &codex.stderr);
     assert!(codex.success, "codex exec failed: {}", codex.stderr);
 
     // Parse metrics.
-    let metrics = parse_metrics(&codex.stdout);
+    let metrics = parse_metrics(&events);
 
     write_artifact(
         &artifact_dir.join("metadata.toml"),
@@ -348,14 +372,11 @@ fn write_artifact(path: &Path, content: &str) {
     fs::write(path, content).unwrap();
 }
 
-fn tool_transcript(jsonl: &str) -> String {
+fn tool_transcript(events: &[serde_json::Value]) -> String {
     let mut out = String::new();
     let mut count = 0;
 
-    for line in jsonl.lines() {
-        let Ok(event) = serde_json::from_str::<serde_json::Value>(line) else {
-            continue;
-        };
+    for event in events {
         if event.get("type").and_then(|t| t.as_str()) != Some("item.completed") {
             continue;
         }
@@ -382,25 +403,20 @@ fn tool_transcript(jsonl: &str) -> String {
     out
 }
 
-fn pretty_codex_jsonl(jsonl: &str) -> String {
-    let events: Vec<serde_json::Value> = jsonl
-        .lines()
-        .map(|line| serde_json::from_str(line).unwrap())
-        .collect();
-    let mut text = serde_json::to_string_pretty(&events).unwrap();
+fn pretty_codex_events(events: &[serde_json::Value]) -> String {
+    let mut text = serde_json::to_string_pretty(events).unwrap();
     text.push('\n');
     text
 }
 
-fn readable_codex_jsonl(jsonl: &str) -> String {
+fn readable_codex_events(events: &[serde_json::Value]) -> String {
     let mut out = String::new();
 
-    for (idx, line) in jsonl.lines().enumerate() {
-        let event = serde_json::from_str::<serde_json::Value>(line).unwrap();
+    for (idx, event) in events.iter().enumerate() {
         if idx > 0 {
             out.push_str("\n\n");
         }
-        write_readable_value(&mut out, "", &event);
+        write_readable_value(&mut out, "", event);
     }
 
     if !out.is_empty() {
@@ -1,8 +1,9 @@
 use std::collections::HashSet;
 use std::io;
+use std::sync::mpsc;
 use std::time::Instant;
 
-use ignore::WalkBuilder;
+use ignore::{WalkBuilder, WalkState};
 use tracing::info;
 
 use llmcc_core::context::{BuildMetrics, FileOrder};
@@ -142,11 +143,14 @@ impl Runner {
     fn discover_files(&self, extensions: &[&str]) -> Result<Vec<String>> {
         let started = Instant::now();
         let threads = std::thread::available_parallelism().map_or(1, |count| count.get());
+        // A single walk root never yields the same path twice, so only pay for
+        // de-duplication when several inputs can overlap.
+        let dedup = self.options.files.len() + self.options.dirs.len() > 1;
         let mut seen = HashSet::new();
         let mut files = Vec::new();
 
         let mut push_file = |path: String| {
-            if seen.insert(path.clone()) {
+            if !dedup || seen.insert(path.clone()) {
                 files.push(path);
             }
         };
@@ -165,23 +169,49 @@ impl Runner {
                 .add_custom_ignore_filename(".ripignore")
                 .add_custom_ignore_filename(".llmccignore");
 
-            for entry in builder.build() {
-                let entry = entry.map_err(|err| {
+            // `threads` only takes effect for the parallel walker; collect results
+            // over a channel and sort them so the input order stays deterministic.
+            let (tx, rx) = mpsc::channel();
+            builder.build_parallel().run(|| {
+                let tx = tx.clone();
+                Box::new(move |entry| {
+                    let entry = match entry {
+                        Ok(entry) => entry,
+                        Err(err) => {
+                            let _ = tx.send(Err(err));
+                            return WalkState::Quit;
+                        }
+                    };
+
+                    let path = entry.path();
+                    let matches = entry.file_type().is_some_and(|kind| kind.is_file())
+                        && path
+                            .extension()
+                            .and_then(|value| value.to_str())
+                            .is_some_and(|extension| extensions.contains(&extension));
+                    if matches {
+                        // Reuse the walker's path buffer; only non-UTF-8 paths need a copy.
+                        let path = entry
+                            .into_path()
+                            .into_os_string()
+                            .into_string()
+                            .unwrap_or_else(|path| path.to_string_lossy().into_owned());
+                        let _ = tx.send(Ok(path));
+                    }
+                    WalkState::Continue
+                })
+            });
+            drop(tx);
+
+            let mut walked = Vec::new();
+            for result in rx {
+                walked.push(result.map_err(|err| {
                     io::Error::other(format!("failed to walk directory {dir}: {err}"))
-                })?;
-
-                if !entry.file_type().is_some_and(|kind| kind.is_file()) {
-                    continue;
-                }
-
-                let path = entry.path();
-                let Some(extension) = path.extension().and_then(|value| value.to_str()) else {
-                    continue;
-                };
-
-                if extensions.contains(&extension) {
-                    push_file(path.to_string_lossy().into_owned());
-                }
+                })?);
+            }
+            walked.sort_unstable();
+            for path in walked {
+                push_file(path);
             }
         }
 
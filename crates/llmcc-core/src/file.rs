@@ -8,7 +8,9 @@ use std::sync::Arc;
 #[derive(Debug, Clone, Default)]
 pub struct FileId {
     pub path: Option<String>,
-    content: Arc<[u8]>,
+    // `Arc<Vec<u8>>` rather than `Arc<[u8]>`: converting the read buffer into an
+    // `Arc<[u8]>` would copy every source file once more after reading it.
+    content: Arc<Vec<u8>>,
     pub content_hash: u64,
 }
 
@@ -25,7 +27,7 @@ impl FileId {
 
         Ok(FileId {
             path: Some(path),
-            content: Arc::from(content),
+            content: Arc::new(content),
             content_hash,
         })
     }
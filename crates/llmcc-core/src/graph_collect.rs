@@ -83,9 +83,10 @@ impl CollectedGraph {
     /// Keep only nodes whose block_id is in `keep`, and edges between them.
     fn retain_nodes(mut self, keep: &HashSet<BlockId>) -> Self {
         self.nodes.retain(|n| keep.contains(&n.block_id));
-        let node_ids: HashSet<BlockId> = self.nodes.iter().map(|n| n.block_id).collect();
+        // Edge endpoints are always collected nodes, so `keep` already tells
+        // whether both ends survived.
         self.edges
-            .retain(|e| node_ids.contains(&e.from_id) && node_ids.contains(&e.to_id));
+            .retain(|e| keep.contains(&e.from_id) && keep.contains(&e.to_id));
         self
     }
 }
@@ -183,22 +183,25 @@ struct PackageLayout {
 
 impl PackageLayout {
     fn discover(files: &[PathBuf], manifest_names: &'static [&'static str]) -> Vec<Self> {
-        let mut roots = HashSet::new();
+        // Directories whose nearest manifest has already been resolved. Sibling
+        // files share ancestors, so each directory is probed at most once.
+        let mut visited = HashSet::new();
         let mut packages = Vec::new();
 
         for file in files {
             for dir in file.ancestors().skip(1) {
+                if !visited.insert(dir.to_path_buf()) {
+                    break;
+                }
                 if let Some(manifest_name) = manifest_names
                     .iter()
                     .copied()
                     .find(|manifest_name| dir.join(manifest_name).exists())
                 {
-                    if roots.insert(dir.to_path_buf()) {
-                        packages.push(Self::manifest(
-                            dir.to_path_buf(),
-                            manifest_package_name(dir, manifest_name),
-                        ));
-                    }
+                    packages.push(Self::manifest(
+                        dir.to_path_buf(),
+                        manifest_package_name(dir, manifest_name),
+                    ));
                     break;
                 }
             }
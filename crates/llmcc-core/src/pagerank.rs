@@ -422,9 +422,20 @@ impl RankedBlocks {
             return self.top(k);
         }
 
+        if k == 0 {
+            return Vec::new();
+        }
+
         let mut blocks: Vec<_> = self.blocks.iter().collect();
-        blocks.sort_by(|left, right| Self::compare(left, right, metric));
-        blocks.into_iter().take(k).cloned().collect()
+        let compare =
+            |left: &&RankedBlock, right: &&RankedBlock| Self::compare(left, right, metric);
+        // Only the first `k` need ordering; partition them out before sorting.
+        if k < blocks.len() {
+            blocks.select_nth_unstable_by(k - 1, compare);
+            blocks.truncate(k);
+        }
+        blocks.sort_by(compare);
+        blocks.into_iter().cloned().collect()
     }
 
     fn scores_by_block(&self, metric: RankMetric) -> HashMap<BlockId, f64> {
@@ -564,16 +575,33 @@ impl<'graph, 'tcx> PageRanker<'graph, 'tcx> {
             return Ok(RankingResult::empty());
         }
 
-        let adjacency_influence =
-            self.build_adjacency(&entries, self.options.relation_weights.influence());
-        let adjacency_orchestration =
-            self.build_adjacency(&entries, self.options.relation_weights.orchestration());
-
         let teleport = self.build_teleport_vector(&entries);
+        let index_by_block: HashMap<BlockId, usize> = entries
+            .iter()
+            .enumerate()
+            .map(|(idx, entry)| (entry.block_id, idx))
+            .collect();
 
-        let influence = PageRankRun::compute(&adjacency_influence, &teleport, &self.options);
-        let orchestration =
-            PageRankRun::compute(&adjacency_orchestration, &teleport, &self.options);
+        // The two passes share only read-only inputs, so run them side by side.
+        let relation_weights = &self.options.relation_weights;
+        let (influence, orchestration) = rayon::join(
+            || {
+                self.run_pass(
+                    &entries,
+                    &index_by_block,
+                    &teleport,
+                    relation_weights.influence(),
+                )
+            },
+            || {
+                self.run_pass(
+                    &entries,
+                    &index_by_block,
+                    &teleport,
+                    relation_weights.orchestration(),
+                )
+            },
+        );
 
         let blended_scores =
             PageRankRun::blend(&influence, &orchestration, self.options.score_weights()?);
@@ -602,6 +630,18 @@ impl<'graph, 'tcx> PageRanker<'graph, 'tcx> {
         })
     }
 
+    /// Build the adjacency for one relation set and run PageRank over it.
+    fn run_pass(
+        &self,
+        entries: &[BlockEntry],
+        index_by_block: &HashMap<BlockId, usize>,
+        teleport: &[f64],
+        relations: impl IntoIterator<Item = (BlockRelation, f64)>,
+    ) -> PageRankRun {
+        let adjacency = self.build_adjacency(entries, index_by_block, relations);
+        PageRankRun::compute(&adjacency, teleport, &self.options)
+    }
+
     fn build_teleport_vector(&self, entries: &[BlockEntry]) -> Vec<f64> {
         let mut priors = Vec::with_capacity(entries.len());
         for entry in entries {
@@ -650,18 +690,17 @@ impl<'graph, 'tcx> PageRanker<'graph, 'tcx> {
     }
 
     /// Build weighted adjacency from relation types.
+    ///
+    /// `index_by_block` maps each entry's block id to its position in `entries`
+    /// and is shared by both passes.
     fn build_adjacency(
         &self,
         entries: &[BlockEntry],
+        index_by_block: &HashMap<BlockId, usize>,
         relations: impl IntoIterator<Item = (BlockRelation, f64)>,
     ) -> WeightedAdjacency {
         let relations: Vec<_> = relations.into_iter().collect();
         let mut adjacency = Vec::with_capacity(entries.len());
-        let mut index_by_block: HashMap<BlockId, usize> = HashMap::new();
-
-        for (idx, entry) in entries.iter().enumerate() {
-            index_by_block.insert(entry.block_id, idx);
-        }
 
         for (idx, entry) in entries.iter().enumerate() {
             let mut weighted = WeightedEdges::new();
@@ -761,16 +800,23 @@ impl WeightedEdges {
             })
             .collect();
 
-        self.edges_by_weight.sort_by(|left, right| {
+        let compare = |left: &WeightedEdge, right: &WeightedEdge| {
             right
                 .weight
                 .total_cmp(&left.weight)
                 .then_with(|| left.target.cmp(&right.target))
-        });
+        };
 
         if let Some(max_len) = max_len {
-            self.edges_by_weight.truncate(max_len);
+            if max_len == 0 {
+                self.edges_by_weight.clear();
+            } else if max_len < self.edges_by_weight.len() {
+                self.edges_by_weight
+                    .select_nth_unstable_by(max_len - 1, compare);
+                self.edges_by_weight.truncate(max_len);
+            }
         }
+        self.edges_by_weight.sort_by(compare);
         self.total_weight = self.edges_by_weight.iter().map(|edge| edge.weight).sum();
     }
 
@@ -806,6 +852,22 @@ impl PageRankRun {
         let mut ranks = teleport.to_vec();
         let mut next_ranks = vec![0.0; node_count];
 
+        // Normalize out-edges once instead of dividing by the node's total weight
+        // on every iteration. Nodes left without edges are sinks.
+        let transitions: Vec<Vec<(usize, f64)>> = adjacency
+            .iter()
+            .map(|neighbors| {
+                let total_weight = neighbors.total_weight();
+                if neighbors.is_empty() || total_weight <= f64::EPSILON {
+                    return Vec::new();
+                }
+                neighbors
+                    .iter()
+                    .map(|edge| (edge.target, edge.weight / total_weight))
+                    .collect()
+            })
+            .collect();
+
         let mut iterations = 0;
         let mut converged = false;
 
@@ -816,21 +878,15 @@ impl PageRankRun {
             }
 
             let mut sink_mass = 0.0;
-            for (idx, neighbors) in adjacency.iter().enumerate() {
-                if neighbors.is_empty() {
-                    sink_mass += ranks[idx];
-                    continue;
-                }
-
-                let total_weight = neighbors.total_weight();
-                if total_weight <= f64::EPSILON {
+            for (idx, edges) in transitions.iter().enumerate() {
+                if edges.is_empty() {
                     sink_mass += ranks[idx];
                     continue;
                 }
 
-                for edge in neighbors.iter() {
-                    let share = ranks[idx] * options.damping_factor * (edge.weight / total_weight);
-                    next_ranks[edge.target] += share;
+                let contribution = ranks[idx] * options.damping_factor;
+                for &(target, share) in edges {
+                    next_ranks[target] += contribution * share;
                 }
             }
 
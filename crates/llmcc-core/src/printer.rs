@@ -284,9 +284,9 @@ struct SourceSpan {
 }
 
 impl SourceSpan {
-    fn from_bytes(unit: CompileUnit<'_>, start_byte: usize, end_byte: usize) -> Self {
-        let start_line = line_for_byte(unit, start_byte);
-        let end_line = line_for_byte(unit, end_byte.saturating_sub(1));
+    fn from_bytes(line_starts: &[usize], start_byte: usize, end_byte: usize) -> Self {
+        let start_line = line_for_byte(line_starts, start_byte);
+        let end_line = line_for_byte(line_starts, end_byte.saturating_sub(1));
         Self {
             start_line,
             end_line: end_line.max(start_line),
@@ -347,11 +347,16 @@ impl RenderNode {
 
 struct TreeBuilder<'cfg> {
     config: &'cfg PrintConfig,
+    /// Byte offsets where each source line starts, shared by every span lookup.
+    line_starts: Vec<usize>,
 }
 
 impl<'cfg> TreeBuilder<'cfg> {
-    fn new(config: &'cfg PrintConfig) -> Self {
-        Self { config }
+    fn new(config: &'cfg PrintConfig, unit: CompileUnit<'_>) -> Self {
+        Self {
+            config,
+            line_starts: line_starts(unit.file().content()),
+        }
     }
 
     fn ast_tree(&self, unit: CompileUnit<'_>) -> Result<RenderNode> {
@@ -381,17 +386,17 @@ impl<'cfg> TreeBuilder<'cfg> {
             .then(|| parent.and_then(|parent| parent.child_field_name(child_index)))
             .flatten();
 
-        let mut children = Vec::with_capacity(node.child_count());
-        for index in 0..node.child_count() {
-            let Some(child) = node.child(index) else {
-                continue;
-            };
-            children.push(self.ast_node(&*child, Some(node), index, unit, depth + 1)?);
+        // `children_with_fields` walks siblings with a cursor; indexed `child` lookups
+        // rescan the parent's children on every call.
+        let parse_children = node.children_with_fields();
+        let mut children = Vec::with_capacity(parse_children.len());
+        for (index, child) in parse_children.iter().enumerate() {
+            children.push(self.ast_node(&*child.node, Some(node), index, unit, depth + 1)?);
         }
 
         Ok(RenderNode::new(node.label(field_name))
             .with_span(SourceSpan::from_bytes(
-                unit,
+                &self.line_starts,
                 node.start_byte(),
                 node.end_byte(),
             ))
@@ -428,7 +433,11 @@ impl<'cfg> TreeBuilder<'cfg> {
         if let Some(base) = node.try_base() {
             render = render
                 .with_id(format!("hir:{}", base.id))
-                .with_span(SourceSpan::from_bytes(unit, base.start_byte, base.end_byte))
+                .with_span(SourceSpan::from_bytes(
+                    &self.line_starts,
+                    base.start_byte,
+                    base.end_byte,
+                ))
                 .with_snippet(snippet_from_unit(
                     unit,
                     base.start_byte,
@@ -463,7 +472,7 @@ impl<'cfg> TreeBuilder<'cfg> {
         Ok(RenderNode::new(block.to_string())
             .with_id(format!("block:{}", block.id()))
             .with_span(SourceSpan::from_bytes(
-                unit,
+                &self.line_starts,
                 node.start_byte(),
                 node.end_byte(),
             ))
@@ -502,27 +511,28 @@ impl<'cfg> TreeWriter<'cfg> {
     }
 
     fn render_tree(&self, root: &RenderNode) -> String {
-        let mut lines = Vec::new();
-        self.push_tree_node(root, 0, &mut lines);
-        lines.join("\n")
+        let mut output = String::new();
+        self.push_tree_node(root, 0, &mut output);
+        output.pop();
+        output
     }
 
-    fn push_tree_node(&self, node: &RenderNode, depth: usize, lines: &mut Vec<String>) {
+    fn push_tree_node(&self, node: &RenderNode, depth: usize, output: &mut String) {
         let indent = " ".repeat(depth * self.config.indent_width);
         let mut line = format!("{indent}({}", self.node_header(node));
         self.push_snippet(&mut line, node, true);
 
         if node.children.is_empty() {
             line.push(')');
-            self.push_line(lines, line);
+            self.push_line(output, line);
             return;
         }
 
-        self.push_line(lines, line);
+        self.push_line(output, line);
         for child in &node.children {
-            self.push_tree_node(child, depth + 1, lines);
+            self.push_tree_node(child, depth + 1, output);
         }
-        self.push_line(lines, format!("{indent})"));
+        self.push_line(output, format!("{indent})"));
     }
 
     fn render_compact(&self, root: &RenderNode) -> String {
@@ -543,18 +553,19 @@ impl<'cfg> TreeWriter<'cfg> {
     }
 
     fn render_flat(&self, root: &RenderNode) -> String {
-        let mut lines = Vec::new();
-        self.push_flat_node(root, &mut lines);
-        lines.join("\n")
+        let mut output = String::new();
+        self.push_flat_node(root, &mut output);
+        output.pop();
+        output
     }
 
-    fn push_flat_node(&self, node: &RenderNode, lines: &mut Vec<String>) {
+    fn push_flat_node(&self, node: &RenderNode, output: &mut String) {
         let mut line = self.node_header(node);
         self.push_snippet(&mut line, node, false);
-        self.push_line(lines, line);
+        self.push_line(output, line);
 
         for child in &node.children {
-            self.push_flat_node(child, lines);
+            self.push_flat_node(child, output);
         }
     }
 
@@ -591,8 +602,11 @@ impl<'cfg> TreeWriter<'cfg> {
         let _ = write!(line, "|{snippet}|");
     }
 
-    fn push_line(&self, lines: &mut Vec<String>, line: String) {
-        lines.push(limit_line(line, self.config.line_width_limit));
+    /// Append one newline-terminated line to `output`; renderers drop the final
+    /// newline once the whole tree is written.
+    fn push_line(&self, output: &mut String, line: String) {
+        output.push_str(&limit_line(line, self.config.line_width_limit));
+        output.push('\n');
     }
 }
 
@@ -609,7 +623,7 @@ pub fn render_ir_with(
 ) -> Result<IrRender> {
     config.validate()?;
 
-    let builder = TreeBuilder::new(config);
+    let builder = TreeBuilder::new(config, unit);
     let writer = TreeWriter::new(config);
     let ast = writer.render(&builder.ast_tree(unit)?);
     let hir = writer.render(&builder.hir_tree(root, unit)?);
@@ -656,7 +670,7 @@ pub fn render_block_tree_with(
 ) -> Result<String> {
     config.validate()?;
 
-    let tree = TreeBuilder::new(config).block_tree(root, unit)?;
+    let tree = TreeBuilder::new(config, unit).block_tree(root, unit)?;
     Ok(TreeWriter::new(config).render(&tree))
 }
 
@@ -723,10 +737,21 @@ fn collapse_whitespace(text: impl AsRef<str>) -> String {
         .join(" ")
 }
 
-fn line_for_byte(unit: CompileUnit<'_>, byte_pos: usize) -> usize {
-    let content = unit.file().content();
-    let end = byte_pos.min(content.len());
-    content[..end].iter().filter(|byte| **byte == b'\n').count() + 1
+fn line_starts(content: &[u8]) -> Vec<usize> {
+    std::iter::once(0)
+        .chain(
+            content
+                .iter()
+                .enumerate()
+                .filter(|(_, byte)| **byte == b'\n')
+                .map(|(index, _)| index + 1),
+        )
+        .collect()
+}
+
+/// 1-based line containing `byte_pos`, i.e. one plus the newlines before it.
+fn line_for_byte(line_starts: &[usize], byte_pos: usize) -> usize {
+    line_starts.partition_point(|start| *start <= byte_pos)
 }
 
 fn limit_line(line: String, limit: usize) -> String {
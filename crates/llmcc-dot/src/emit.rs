@@ -1,3 +1,5 @@
+use std::borrow::Cow;
+
 use indoc::formatdoc;
 
 use crate::{ClusterKind, DotCluster, DotDocument, DotEdge, DotNode, RenderOptions};
@@ -86,7 +88,7 @@ impl DotEmitter {
         let label = escape(&c.label);
         let i = "  ".repeat(depth + 1);
 
-        self.put(&"  ".repeat(depth));
+        self.indent(depth);
         if self.ai {
             self.put(&formatdoc! {"
                 subgraph cluster_{id} {{
@@ -111,7 +113,7 @@ impl DotEmitter {
             self.node(node, depth + 1);
         }
 
-        self.put(&"  ".repeat(depth));
+        self.indent(depth);
         self.put("}\n\n");
     }
 
@@ -130,7 +132,7 @@ impl DotEmitter {
         } else {
             format_attrs(&node.label, &node.attrs)
         };
-        self.put(&"  ".repeat(depth));
+        self.indent(depth);
         self.put(&formatdoc! {"
             {id}[{attrs}];
         ", id = node.id});
@@ -152,6 +154,13 @@ impl DotEmitter {
     fn put(&mut self, s: &str) {
         self.out.push_str(s);
     }
+
+    /// Write `depth` indentation levels without allocating a padding string.
+    fn indent(&mut self, depth: usize) {
+        for _ in 0..depth {
+            self.out.push_str("  ");
+        }
+    }
 }
 
 // Formatting helpers.
@@ -215,9 +224,20 @@ fn count_clusters(clusters: &[DotCluster]) -> usize {
         .sum()
 }
 
-fn escape(input: &str) -> String {
-    input
-        .replace('\\', "\\\\")
-        .replace('"', "\\\"")
-        .replace('\n', "\\n")
+/// Escape a DOT string literal in one pass, borrowing when nothing needs escaping.
+fn escape(input: &str) -> Cow<'_, str> {
+    if !input.contains(['\\', '"', '\n']) {
+        return Cow::Borrowed(input);
+    }
+
+    let mut escaped = String::with_capacity(input.len() + 8);
+    for ch in input.chars() {
+        match ch {
+            '\\' => escaped.push_str("\\\\"),
+            '"' => escaped.push_str("\\\""),
+            '\n' => escaped.push_str("\\n"),
+            _ => escaped.push(ch),
+        }
+    }
+    Cow::Owned(escaped)
 }
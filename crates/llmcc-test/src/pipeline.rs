@@ -118,7 +118,15 @@ fn compile_and_render<L: Language>(
     needed: &[OutputKind],
 ) -> Result<BTreeMap<OutputKind, String>> {
     let files = discover_source_files::<L>(root)?;
-    let cc = CompileCtxt::from_files::<L>(&files)?;
+    compile_files::<L>(&files, needed)
+}
+
+/// Compile already-discovered source files and render all requested outputs.
+fn compile_files<L: Language>(
+    files: &[String],
+    needed: &[OutputKind],
+) -> Result<BTreeMap<OutputKind, String>> {
+    let cc = CompileCtxt::from_files::<L>(files)?;
 
     build_hir::<L>(&cc, HirBuildOptions::new().with_sequential(true))?;
 
@@ -144,12 +152,12 @@ fn compile_auto(root: &Path, needed: &[OutputKind]) -> Result<BTreeMap<OutputKin
     let mut merged: BTreeMap<OutputKind, Vec<String>> = BTreeMap::new();
 
     if !rust_files.is_empty() {
-        for (kind, text) in compile_and_render::<LangRust>(root, needed)? {
+        for (kind, text) in compile_files::<LangRust>(&rust_files, needed)? {
             merged.entry(kind).or_default().push(text);
         }
     }
     if !ts_files.is_empty() {
-        for (kind, text) in compile_and_render::<LangTypeScript>(root, needed)? {
+        for (kind, text) in compile_files::<LangTypeScript>(&ts_files, needed)? {
             merged.entry(kind).or_default().push(text);
         }
     }
@@ -202,17 +210,15 @@ fn discover_source_files<L: Language>(root: &Path) -> Result<Vec<String>> {
         }
     }
 
-    files.sort_by(|a, b| {
-        let prefix = |p: &str| -> Option<usize> {
-            Path::new(p)
-                .file_name()?
-                .to_str()?
-                .split('_')
-                .next()?
-                .parse()
-                .ok()
-        };
-        prefix(a).cmp(&prefix(b))
+    // Parse each file's numeric prefix once instead of on every comparison.
+    files.sort_by_cached_key(|path| -> Option<usize> {
+        Path::new(path)
+            .file_name()?
+            .to_str()?
+            .split('_')
+            .next()?
+            .parse()
+            .ok()
     });
 
     Ok(files)
@@ -2,12 +2,13 @@
 
 Usage: python scripts/extract_corpus.py <corpus_dir> <output_dir> [--lang rust]
 """
-import os
-import re
 import sys
 from pathlib import Path
 
 BANNER = "=" * 79
+# Line prefixes that mark tree-sitter corpus case banners and code/tree separators.
+CASE_BANNER_PREFIX = "=" * 20
+SEPARATOR_PREFIX = "-" * 20
 
 
 def slugify(name: str) -> str:
@@ -39,14 +40,14 @@ def parse_tree_sitter_corpus(path: Path) -> list[dict]:
 
     while i < len(lines):
         # Find opening banner
-        if not lines[i].strip().startswith("=" * 20):
+        if not lines[i].strip().startswith(CASE_BANNER_PREFIX):
             i += 1
             continue
 
         i += 1
         # Read name (may span multiple lines, take first non-empty)
         name = ""
-        while i < len(lines) and not lines[i].strip().startswith("=" * 20):
+        while i < len(lines) and not lines[i].strip().startswith(CASE_BANNER_PREFIX):
             if lines[i].strip() and not name:
                 name = lines[i].strip()
             i += 1
@@ -58,14 +59,14 @@ def parse_tree_sitter_corpus(path: Path) -> list[dict]:
         # Read code until separator (---...---)
         code_lines = []
         while i < len(lines):
-            if lines[i].strip().startswith("-" * 20):
+            if lines[i].strip().startswith(SEPARATOR_PREFIX):
                 i += 1
                 break
             code_lines.append(lines[i])
             i += 1
 
         # Skip the s-expression (until next banner or EOF)
-        while i < len(lines) and not lines[i].strip().startswith("=" * 20):
+        while i < len(lines) and not lines[i].strip().startswith(CASE_BANNER_PREFIX):
             i += 1
 
         # Trim trailing empty lines from code
@@ -85,11 +86,12 @@ def write_llmcc_file(cases: list[dict], output_path: Path, file_name: str = "src
     parts = []
     for case in cases:
         slug = slugify(case["name"])
-        part = f"{BANNER}\n{slug}\n{BANNER}\n\n"
-        part += f"--- file: {file_name} ---\n"
-        part += case["code"] + "\n"
-        part += "\n--- expect:block-graph ---\n"
-        parts.append(part)
+        parts.append(
+            f"{BANNER}\n{slug}\n{BANNER}\n\n"
+            f"--- file: {file_name} ---\n"
+            f"{case['code']}\n"
+            "\n--- expect:block-graph ---\n"
+        )
 
     content = "\n\n".join(parts) + "\n"
     output_path.write_text(content, encoding="utf-8", newline="\n")